@@ -1,33 +1,65 @@
 # __init__.py
 
 import logging
+from collections.abc import Coroutine, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.typing import ConfigType
+from homeassistant.helpers.debounce import Debouncer
 
-# Assuming your const.py defines DOMAIN and PLATFORMS (likely ["climate"])
-from .const import DOMAIN, PLATFORMS
+# Assuming your const.py defines PLATFORMS (likely ("climate",))
+from .const import PLATFORMS
 
 _LOGGER = logging.getLogger(__name__)
 
-# --- Main Setup Function ---
-async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
-    """Set up the My Heater component."""
-    # This is usually empty for config flow integrations
-    hass.data.setdefault(DOMAIN, {})
-    _LOGGER.debug("Async_setup called for My Heater")
-    return True
+OPTIONS_RELOAD_COOLDOWN = 1.0  # Seconds to coalesce rapid options saves into one reload
+
+
+@dataclass
+class MyHeaterRuntimeData:
+    """Per-entry data kept on the config entry while it is loaded."""
+
+    data: Mapping[str, Any]     # Read-only view of entry.data
+    options: dict[str, Any]     # Options snapshot taken at setup, to detect no-op saves
+    reload_debouncer: Debouncer[Coroutine[Any, Any, None]]
+
+
+# Config entry carrying MyHeaterRuntimeData as runtime_data
+MyHeaterConfigEntry = ConfigEntry[MyHeaterRuntimeData]
 
 # --- Setup Entry from Config Flow ---
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_setup_entry(hass: HomeAssistant, entry: MyHeaterConfigEntry) -> bool:
     """Set up My Heater from a config entry."""
     _LOGGER.debug("Setting up config entry: %s", entry.entry_id)
-    hass.data[DOMAIN][entry.entry_id] = entry.data # Store data if needed centrally
+
+    async def _async_reload_entry() -> None:
+        """Reload the entry once the options debounce window has passed."""
+        await hass.config_entries.async_reload(entry.entry_id)
+
+    reload_debouncer = Debouncer(
+        hass,
+        _LOGGER,
+        cooldown=OPTIONS_RELOAD_COOLDOWN,
+        immediate=False,
+        function=_async_reload_entry,
+    )
+    entry.async_on_unload(reload_debouncer.async_shutdown)
+
+    # Read-only view so platforms can't mutate the entry's internal data
+    entry.runtime_data = MyHeaterRuntimeData(
+        data=MappingProxyType(entry.data),
+        options=dict(entry.options),
+        reload_debouncer=reload_debouncer,
+    )
 
     # --- Register the update listener ---
-    # This listener will be called when options are updated
-    entry.async_on_unload(entry.add_update_listener(async_update_options_listener))
+    # This listener will be called when options are updated. The unsub must be
+    # handed to async_on_unload, otherwise every reload stacks another listener.
+    unsub_options = entry.add_update_listener(async_update_options_listener)
+    entry.async_on_unload(unsub_options)
 
     # Forward the setup to the climate platform
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -35,7 +67,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 # --- Unload Entry ---
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_unload_entry(hass: HomeAssistant, entry: MyHeaterConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.debug("Unloading config entry: %s", entry.entry_id)
 
@@ -43,16 +75,19 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        # Clean up hass.data if you stored anything there for this entry
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        # runtime_data is owned by the entry itself, nothing to pop from hass.data
         _LOGGER.debug("Successfully unloaded entry: %s", entry.entry_id)
 
     return unload_ok
 
 # --- Options Update Listener ---
-async def async_update_options_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+async def async_update_options_listener(hass: HomeAssistant, entry: MyHeaterConfigEntry) -> None:
     """Handle options update."""
     # This function is called when the user saves changes in the options flow.
     # The most common action is to reload the config entry to apply the changes.
+    if entry.options == entry.runtime_data.options:
+        _LOGGER.debug("Options unchanged for %s, skipping reload.", entry.entry_id)
+        return
     _LOGGER.info("Options updated for %s, reloading integration.", entry.entry_id)
-    await hass.config_entries.async_reload(entry.entry_id)
\ No newline at end of file
+    # Debounced so a burst of saves results in a single reload
+    await entry.runtime_data.reload_debouncer.async_call()
\ No newline at end of file
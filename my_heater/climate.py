@@ -1,36 +1,49 @@
 # climate.py
 
 import asyncio
-from datetime import datetime, timedelta, timezone
+from datetime import datetime
 import logging
+import time
 
 # Core Home Assistant components
 from homeassistant.components.climate import ClimateEntity, ClimateEntityFeature
 from homeassistant.components.climate.const import HVACMode
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import ATTR_TEMPERATURE
+from homeassistant.const import ATTR_TEMPERATURE, STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import HomeAssistant, callback, Event, State # Added State for type hinting
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 # Event helpers
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_change_event,
+)
 # State restoration helper
-from homeassistant.helpers.restore_state import RestoreEntity # Use RestoreEntity for state restoration capabilities
+from homeassistant.helpers.restore_state import RestoredExtraData, RestoreEntity # Use RestoreEntity for state restoration capabilities
+from homeassistant.util import dt as dt_util
 
 # Local constants
+from . import MyHeaterConfigEntry
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
 # --- Configuration Constants ---
-MONITORING_INTERVAL_SECONDS = 120  # How often to check temp/power in HEAT mode
 Sleep_After_Power_Off = 60      # How long to wait after timer OFF before checking power again
 SCENE_ACTIVATION_DELAY = 1.0     # Short delay after activating some scenes
+TEMP_STEP_DELAY = 1.5            # Delay between successive temperature step scenes
+SET_TEMP_DEBOUNCE_SECONDS = 0.3  # Quiet period before applying a new target temperature
+SCENE_COALESCE_SECONDS = 0.25    # Repeat ON/OFF toggle fires within this window are dropped
 VOLTAGE_ON_THRESHOLD = 10       # Power (W or kW) threshold to consider the heater ON
 AUTO_ON_COOLDOWN_SECONDS = 15    # Min duration after manual OFF before auto ON can trigger
+MODE_CHANGE_COOLDOWN_SECONDS = 10  # Delay before HEAT if the mode changed this recently
+MONITORING_INTERVAL_SECONDS = 120  # Min time between temperature maintenance runs in HEAT mode
+
+# Precomputed set used on every sensor event
+_UNAVAILABLE_STATES = frozenset((None, STATE_UNKNOWN, STATE_UNAVAILABLE))
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    config_entry: ConfigEntry,
+    config_entry: MyHeaterConfigEntry,
     async_add_entities: AddEntitiesCallback
 ):
     """Set up climate entities for My Heater from config entry."""
@@ -59,87 +72,129 @@ class MyHeaterClimate(ClimateEntity, RestoreEntity):
     _attr_hvac_modes = [HVACMode.OFF, HVACMode.HEAT]
     _attr_supported_features = ClimateEntityFeature.TARGET_TEMPERATURE
     _attr_has_entity_name = True
+    _attr_should_poll = False  # State is pushed from sensor listeners, never polled
+
+    # Slot our own per-instance state; the HA base classes still provide
+    # __dict__ for the _attr_* attributes they manage.
+    __slots__ = (
+        "_hass",
+        "config_entry",
+        "_scene_turn_on_off",
+        "_temperature_sensor",
+        "_temperature_up_scene",
+        "_temperature_down_scene",
+        "_scene_payloads",
+        "_last_toggle_fire",
+        "_power_usage_sensor",
+        "_default_temp",
+        "_timer_cancel",
+        "_pending_off_recheck",
+        "_off_sequence_active",
+        "_heat_start_time",
+        "_timer_seconds",
+        "last_mode_change_time",
+        "_cached_temp",
+        "_cached_power",
+        "_last_written_state",
+        "_pending_target",
+        "_apply_debouncer",
+        "_maintenance_task",
+        "_last_maintenance",
+    )
 
     def __init__(
         self,
         hass: HomeAssistant,
-        config_entry: ConfigEntry,
+        config_entry: MyHeaterConfigEntry,
     ):
         """Initialize the My Heater climate entity."""
         self._hass = hass
         self.config_entry = config_entry
 
-        # --- Extract configuration from config_entry ---
+        # --- Extract configuration from the entry's runtime data ---
+        data = config_entry.runtime_data.data
         # Use .get for safer access, though name is usually set
-        self._attr_name = self.config_entry.data.get("heater_name", "My Heater")
-        self._scene_turn_on_off = self.config_entry.data["scene_turn_on_off"]
-        self._temperature_sensor = self.config_entry.data["temperature_sensor"]
-        self._temperature_up_scene = self.config_entry.data["temperature_up_scene"]
-        self._temperature_down_scene = self.config_entry.data["temperature_down_scene"]
-
-        self._power_usage_sensor = self.config_entry.data.get("power_usage")
+        self._attr_name = data.get("heater_name", "My Heater")
+        self._scene_turn_on_off = data["scene_turn_on_off"]
+        self._temperature_sensor = data["temperature_sensor"]
+        self._temperature_up_scene = data["temperature_up_scene"]
+        self._temperature_down_scene = data["temperature_down_scene"]
+        # Service payloads built once; HA copies service_data, so sharing them is safe
+        self._scene_payloads = {
+            scene: {"entity_id": scene}
+            for scene in (self._scene_turn_on_off, self._temperature_up_scene, self._temperature_down_scene)
+            if scene
+        }
+        self._last_toggle_fire = float("-inf") # Monotonic time the ON/OFF toggle scene last fired
+
+        self._power_usage_sensor = data.get("power_usage")
         # Basic validation (more robust check happens in async_setup_entry)
         if not self._power_usage_sensor:
              _LOGGER.warning("%s: Power sensor ID is missing in config data.", self._attr_name)
 
         # Store min/max/default temps from config
-        self._attr_min_temp = self.config_entry.data["min_temp"]
-        self._attr_max_temp = self.config_entry.data["max_temp"]
-        self._default_temp = self.config_entry.data["default_temp"] # Store default separately
+        self._attr_min_temp = data["min_temp"]
+        self._attr_max_temp = data["max_temp"]
+        self._default_temp = data["default_temp"] # Store default separately
 
         # --- Entity State (initialized here, potentially overridden by restoration) ---
         self._attr_hvac_mode = HVACMode.OFF
         self._attr_target_temperature = self._default_temp # Initialize with default
 
         # --- Internal State Management ---
-        self._monitoring_task = None        # Holds the asyncio task for monitoring
+        self._timer_cancel = None           # Cancels the scheduled off-timer
+        self._pending_off_recheck = None    # Cancels the delayed power recheck after timer OFF
+        self._off_sequence_active = False   # Timer OFF sequence running (first press until recheck done)
         self._heat_start_time = None        # When heating started (for timer)
-        self._options_listener_remove = None # To unsubscribe from options updates
-        self.last_mode_change_time = None   # Track last mode change for cooldowns
-        self._power_sensor_listener_remove = None # To unsubscribe from power sensor updates
+        self._timer_seconds = self._load_timer_seconds() # Cached; an options change reloads the entry
+        self.last_mode_change_time = None   # time.monotonic() of last mode change, for cooldowns
+        self._cached_temp: float | None = None   # Last parsed temperature sensor value
+        self._cached_power: float | None = None  # Last parsed power sensor value
+        self._last_written_state = None     # (hvac_mode, target_temp, current_temp) last published
+        self._pending_target = None         # Latest requested target, applied by the debouncer
+        self._maintenance_task = None       # Background task running _maintain_temperature
+        self._last_maintenance = None       # time.monotonic() the last maintenance run was scheduled
+        self._apply_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=SET_TEMP_DEBOUNCE_SECONDS,
+            immediate=False,
+            function=self._apply_target_temperature,
+        )
 
         # --- Unique ID ---
         # Ensure a unique ID based on the config entry for persistence
         self._attr_unique_id = f"{config_entry.entry_id}_climate"
 
 
-    # --- Helper Property for Timer Duration ---
-    @property
-    def _timer_duration_minutes(self) -> int:
-        """Return the configured timer duration in minutes."""
-        # Get timer from options first, fallback to initial data
+    # --- Helper for Timer Duration ---
+    def _load_timer_seconds(self) -> int:
+        """Return the configured timer duration in seconds."""
+        # Get timer (minutes) from options first, fallback to initial data
         return self.config_entry.options.get(
-            "timer", self.config_entry.data.get("timer", 0)
-        )
+            "timer", self.config_entry.runtime_data.data.get("timer", 0)
+        ) * 60
 
     # --- Standard Properties ---
     @property
     def current_temperature(self):
-        """Get the current temperature from the sensor."""
-        if not self._temperature_sensor: return None
-        sensor_state = self._hass.states.get(self._temperature_sensor)
-        if sensor_state and sensor_state.state not in (None, "unknown", "unavailable"):
-            try:
-                return float(sensor_state.state)
-            except (ValueError, TypeError):
-                _LOGGER.warning(
-                    "%s: Sensor %s returned invalid temperature: %s",
-                    self.entity_id, self._temperature_sensor, sensor_state.state,
-                )
-        return None
+        """Return the last temperature pushed by the sensor."""
+        return self._cached_temp
 
     @property
     def current_power_usage(self):
-        """Get the current power usage from the sensor."""
-        if not self._power_usage_sensor: return None
-        sensor_state = self._hass.states.get(self._power_usage_sensor)
-        if sensor_state and sensor_state.state not in (None, "unknown", "unavailable"):
+        """Return the last power usage pushed by the sensor."""
+        return self._cached_power
+
+    def _parse_sensor_state(self, sensor_state: State | None, sensor_id, description):
+        """Parse a sensor state to float, returning None if unavailable or invalid."""
+        if sensor_state and sensor_state.state not in _UNAVAILABLE_STATES:
             try:
                 return float(sensor_state.state)
             except (ValueError, TypeError):
                 _LOGGER.warning(
-                    "%s: Power usage sensor %s returned invalid value: %s",
-                    self.entity_id, self._power_usage_sensor, sensor_state.state,
+                    "%s: %s %s returned invalid value: %s",
+                    self.entity_id, description, sensor_id, sensor_state.state,
                 )
         return None
 
@@ -149,10 +204,21 @@ class MyHeaterClimate(ClimateEntity, RestoreEntity):
         return 1.0
 
 
+    # --- State Publishing ---
+    @callback
+    def _write_state_if_changed(self) -> None:
+        """Write state to HA only if mode, target or current temperature changed."""
+        state = (self._attr_hvac_mode, self._attr_target_temperature, self._cached_temp)
+        if state == self._last_written_state:
+            return
+        self._last_written_state = state
+        self.async_write_ha_state()
+
+
     # --- Core Methods ---
     async def async_set_hvac_mode(self, hvac_mode):
         """Set the HVAC mode via Home Assistant service call."""
-        now = datetime.now(timezone.utc)
+        now = time.monotonic()
         current_mode = self._attr_hvac_mode
 
         _LOGGER.debug("%s: async_set_hvac_mode called: requested=%s, current=%s", self.entity_id, hvac_mode, current_mode)
@@ -161,8 +227,9 @@ class MyHeaterClimate(ClimateEntity, RestoreEntity):
              _LOGGER.debug("%s: Requested HVAC mode %s is already active.", self.entity_id, hvac_mode)
              return
 
-        # Stop any existing monitoring task before changing mode
-        await self._stop_monitoring_task()
+        # Cancel any running off-timer before changing mode; the user's mode wins over a timer OFF
+        self._cancel_off_timer()
+        self._off_sequence_active = False
         scene_activated = False
 
         if hvac_mode == HVACMode.HEAT:
@@ -170,10 +237,10 @@ class MyHeaterClimate(ClimateEntity, RestoreEntity):
             # Simple cooldown to prevent rapid toggling via UI/automation
             if (
                 self.last_mode_change_time is not None
-                and self.last_mode_change_time > now - timedelta(seconds=10)
+                and now - self.last_mode_change_time < MODE_CHANGE_COOLDOWN_SECONDS
             ):
-                _LOGGER.debug("%s: Mode changed recently, delaying 10s before switching to HEAT.", self.entity_id)
-                await asyncio.sleep(10)
+                _LOGGER.debug("%s: Mode changed recently, delaying %ds before switching to HEAT.", self.entity_id, MODE_CHANGE_COOLDOWN_SECONDS)
+                await asyncio.sleep(MODE_CHANGE_COOLDOWN_SECONDS)
 
             power = self.current_power_usage
             _LOGGER.debug("%s: Checking power usage for HEAT mode switch: value=%s, threshold=%s", self.entity_id, power, VOLTAGE_ON_THRESHOLD)
@@ -181,39 +248,38 @@ class MyHeaterClimate(ClimateEntity, RestoreEntity):
             # Activate ON scene only if power is low/unknown (or sensor missing)
             if self._power_usage_sensor and (power is None or power < VOLTAGE_ON_THRESHOLD):
                  _LOGGER.debug("%s: Power usage low/unknown. Activating ON/OFF scene for HEAT.", self.entity_id)
-                 scene_activated = await self._activate_scene(self._scene_turn_on_off, "turn ON for HEAT")
-                 if scene_activated: await asyncio.sleep(SCENE_ACTIVATION_DELAY)
+                 scene_activated = await self._press_scene(self._scene_turn_on_off, "turn ON for HEAT")
             elif not self._power_usage_sensor:
                  _LOGGER.debug("%s: Power sensor not configured. Activating ON/OFF scene for HEAT as failsafe.", self.entity_id)
-                 scene_activated = await self._activate_scene(self._scene_turn_on_off, "turn ON for HEAT (no power sensor)")
-                 if scene_activated: await asyncio.sleep(SCENE_ACTIVATION_DELAY)
+                 scene_activated = await self._press_scene(self._scene_turn_on_off, "turn ON for HEAT (no power sensor)")
             else:
                  # Power is high, assume already ON physically
                  _LOGGER.debug("%s: Power usage (%.2f) >= threshold (%s). Assuming ON. Skipping scene activation.", self.entity_id, power, VOLTAGE_ON_THRESHOLD)
 
-            # Set internal state and start monitoring
+            # Set internal state and arm the off-timer
             self._attr_hvac_mode = HVACMode.HEAT
-            self._heat_start_time = now # Record start time for timer
+            self._heat_start_time = dt_util.utcnow() # Record start time for timer
             self.last_mode_change_time = now # Record mode change time
-            await self._start_monitoring_task()
-            _LOGGER.info("%s: Set HVAC mode to HEAT. Monitoring task started. Scene activated: %s", self.entity_id, scene_activated)
+            self._arm_off_timer()
+            self._maybe_maintain_temperature()
+            _LOGGER.info("%s: Set HVAC mode to HEAT. Off-timer armed if configured. Scene activated: %s", self.entity_id, scene_activated)
 
         elif hvac_mode == HVACMode.OFF:
             _LOGGER.debug("%s: Attempting to switch to OFF mode.", self.entity_id)
             # Activate the OFF scene
             scene_activated = await self._activate_scene(self._scene_turn_on_off, "turn OFF")
-            # Set internal state (monitoring task already stopped by call above)
+            # Set internal state (off-timer already cancelled by call above)
             self._attr_hvac_mode = HVACMode.OFF
             self._heat_start_time = None # Clear timer start time
             self.last_mode_change_time = now # Record mode change time
-            _LOGGER.info("%s: Set HVAC mode to OFF. Monitoring task stopped. Scene activated: %s", self.entity_id, scene_activated)
+            _LOGGER.info("%s: Set HVAC mode to OFF. Off-timer cancelled. Scene activated: %s", self.entity_id, scene_activated)
 
         else:
              _LOGGER.warning("%s: Unsupported HVAC mode requested: %s.", self.entity_id, hvac_mode)
              return
 
         # Update state in Home Assistant
-        self.async_write_ha_state()
+        self._write_state_if_changed()
 
     async def async_set_temperature(self, **kwargs):
         """Set the target temperature by activating scenes."""
@@ -225,33 +291,51 @@ class MyHeaterClimate(ClimateEntity, RestoreEntity):
             _LOGGER.warning("%s: Target temp %.1f out of range (%.1f-%.1f)", self.entity_id, target_temp, self._attr_min_temp, self._attr_max_temp)
             return
 
+        # Debounced so a burst of slider moves only applies the final target
+        self._pending_target = target_temp
+        await self._apply_debouncer.async_call()
+
+    async def _apply_target_temperature(self) -> None:
+        """Apply the latest requested target, including any set while stepping."""
+        # The debouncer drops calls made while this runs, so a target set during
+        # a multi-step apply is only visible as a new _pending_target here
+        while (target_temp := self._pending_target) is not None:
+            self._pending_target = None
+            await self._step_to_target(target_temp)
+
+    async def _step_to_target(self, target_temp: float) -> None:
+        """Step the heater towards target_temp by activating scenes."""
         current_target = self._attr_target_temperature
-        # Calculate difference in whole steps
-        difference = round(target_temp - current_target)
+        # Calculate difference in whole steps (step size is fixed at 1.0)
+        difference = int(target_temp) - int(current_target)
 
-        if difference == 0:
+        if not difference:
             _LOGGER.debug("%s: Target temp %.1f already set.", self.entity_id, target_temp)
             # Ensure internal state matches requested state if somehow different
             if self._attr_target_temperature != target_temp:
                  self._attr_target_temperature = target_temp
-                 self.async_write_ha_state()
+                 self._write_state_if_changed()
             return
 
         # Determine scene and number of steps
-        if difference > 0:
-            scene, action, steps = self._temperature_up_scene, "increase", difference
-        else: # difference < 0
-            scene, action, steps = self._temperature_down_scene, "decrease", abs(difference)
+        scene, action = (
+            (self._temperature_down_scene, "decrease"),
+            (self._temperature_up_scene, "increase"),
+        )[difference > 0]
+        steps = abs(difference)
 
         _LOGGER.debug("%s: Need to %s temperature by %d steps.", self.entity_id, action, steps)
         success_count = 0
         for i in range(steps):
-            _LOGGER.debug("%s: Activating %s scene (Step %d/%d)", self.entity_id, action, i + 1, steps)
-            if not await self._activate_scene(scene, f"{action} temp step {i+1}"):
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("%s: Activating %s scene (Step %d/%d)", self.entity_id, action, i + 1, steps)
+            # Fire without waiting for the scene to finish; the step delay is the only wait
+            if not await self._activate_scene(scene, f"{action} temp step {i+1}", blocking=False):
                  _LOGGER.error("%s: Stopping temperature change due to scene activation failure on step %d.", self.entity_id, i + 1)
                  break # Stop trying if one activation fails
             success_count += 1
-            await asyncio.sleep(1.5) # Delay between scene activations
+            # Also wait after the last step, so the next target's first press can't follow back-to-back
+            await asyncio.sleep(TEMP_STEP_DELAY)
 
         # Update internal target temperature based on successful steps
         # This makes the UI reflect the change even if not all steps completed
@@ -271,179 +355,194 @@ class MyHeaterClimate(ClimateEntity, RestoreEntity):
                   self.entity_id, target_temp, success_count, steps, self._attr_target_temperature
              )
 
-        self.async_write_ha_state() # Update HA state with the final temperature
+        self._write_state_if_changed() # Update HA state with the final temperature
+        # A stable room sends no sensor events, so re-check against the new target now
+        self._maybe_maintain_temperature()
 
 
-    # --- Monitoring Task Management ---
-    async def _start_monitoring_task(self):
-        """Start the background monitoring task if not already running."""
-        if self._monitoring_task is None or self._monitoring_task.done():
-            _LOGGER.debug("%s: Creating and starting monitoring task.", self.entity_id)
-            self._monitoring_task = self.hass.async_create_task(self._monitor_power_and_temperature())
-        else:
-             _LOGGER.debug("%s: Monitoring task already running or starting.", self.entity_id)
+    # --- Off-Timer Management ---
+    @callback
+    def _arm_off_timer(self):
+        """Arm the off-timer for the current HEAT cycle if one is configured."""
+        if self._timer_cancel is not None:
+            _LOGGER.debug("%s: Off-timer already armed.", self.entity_id)
+            return
 
-    async def _stop_monitoring_task(self):
-        """Stop the background monitoring task gracefully."""
-        if self._monitoring_task and not self._monitoring_task.done():
-            _LOGGER.debug("%s: Attempting to cancel monitoring task.", self.entity_id)
-            self._monitoring_task.cancel()
-            try:
-                await asyncio.wait_for(self._monitoring_task, timeout=2)
-            except asyncio.CancelledError:
-                _LOGGER.debug("%s: Monitoring task cancelled successfully.", self.entity_id)
-            except asyncio.TimeoutError:
-                 _LOGGER.warning("%s: Monitoring task did not cancel within timeout.", self.entity_id)
-            except Exception as e:
-                 _LOGGER.error("%s: Error awaiting monitoring task cancellation: %s", self.entity_id, e)
-            finally:
-                 self._monitoring_task = None
+        if self._timer_seconds <= 0 or self._heat_start_time is None:
+            _LOGGER.debug("%s: Off-timer disabled, not arming.", self.entity_id)
+            return
+
+        elapsed_seconds = (dt_util.utcnow() - self._heat_start_time).total_seconds()
+        delay = max(0, self._timer_seconds - elapsed_seconds)
+        _LOGGER.debug("%s: Arming off-timer to fire in %.0f seconds.", self.entity_id, delay)
+        self._timer_cancel = async_call_later(self.hass, delay, self._async_timer_fire)
+
+    @callback
+    def _cancel_off_timer(self):
+        """Cancel the off-timer, any pending OFF recheck and running maintenance."""
+        if self._timer_cancel is not None:
+            self._timer_cancel()
+            self._timer_cancel = None
+            _LOGGER.debug("%s: Off-timer cancelled.", self.entity_id)
+        if self._pending_off_recheck is not None:
+            self._pending_off_recheck()
+            self._pending_off_recheck = None
+            _LOGGER.debug("%s: Pending timer OFF recheck cancelled.", self.entity_id)
+        # A half-finished UP/DOWN press sequence must not land after a mode change
+        self._cancel_maintenance_task()
+
+
+    # --- Off-Timer Sequence ---
+    async def _async_timer_fire(self, _now: datetime) -> None:
+        """Start the turn OFF sequence once the HEAT-mode timer expires."""
+        self._timer_cancel = None
+        if self._attr_hvac_mode != HVACMode.HEAT:
+            _LOGGER.debug("%s: Off-timer fired but mode is %s. Ignoring.", self.entity_id, self._attr_hvac_mode)
+            return
+        # No UP/DOWN press may land after the OFF press, so stop maintenance before awaiting it
+        self._off_sequence_active = True
+        self._cancel_maintenance_task()
+
+        _LOGGER.info("%s: Timer expired (duration %ds). Initiating turn OFF sequence.", self.entity_id, self._timer_seconds)
+        _LOGGER.debug("%s: Timer Expired: Activating OFF scene (Attempt 1).", self.entity_id)
+        first_activation_success = await self._activate_scene(
+            self._scene_turn_on_off, "timer expired turn OFF (1st attempt)"
+        )
+        if not first_activation_success:
+             _LOGGER.warning("%s: Timer Expired: First attempt to activate OFF scene failed.", self.entity_id)
+        if self._attr_hvac_mode != HVACMode.HEAT:
+            # User changed mode while the OFF scene was in flight; their change wins
+            _LOGGER.debug("%s: Timer Expired: Mode changed to %s during OFF scene. Abandoning OFF sequence.", self.entity_id, self._attr_hvac_mode)
+            self._off_sequence_active = False
+            return
+
+        # Mode stays HEAT until the recheck so auto-on doesn't flip it back meanwhile
+        _LOGGER.debug("%s: Timer Expired: Waiting %d seconds before checking power state.", self.entity_id, Sleep_After_Power_Off)
+        self._pending_off_recheck = async_call_later(
+            self.hass, Sleep_After_Power_Off, self._verify_off
+        )
+
+    async def _verify_off(self, _now: datetime) -> None:
+        """Finish the timer OFF sequence: recheck power and retry the OFF scene if needed."""
+        self._pending_off_recheck = None
+        if self._attr_hvac_mode != HVACMode.HEAT:
+            _LOGGER.debug("%s: Timer Expired: Mode is %s at OFF recheck. Ignoring.", self.entity_id, self._attr_hvac_mode)
+            self._off_sequence_active = False
+            return
+        _LOGGER.debug("%s: Timer Expired: Checking power state after delay.", self.entity_id)
+        power_after_delay = self.current_power_usage
+
+        if self._power_usage_sensor and power_after_delay is not None and power_after_delay >= VOLTAGE_ON_THRESHOLD:
+            _LOGGER.warning(
+                "%s: Timer Expired: Heater power usage (%.2f) still high after %ds. Activating OFF scene again (Attempt 2).",
+                self.entity_id, power_after_delay, Sleep_After_Power_Off
+            )
+            await self._activate_scene(self._scene_turn_on_off, "timer expired turn OFF (2nd attempt)")
+        elif not self._power_usage_sensor:
+             _LOGGER.warning("%s: Timer Expired: Cannot verify power state after delay (no power sensor). Assuming OFF sequence complete.", self.entity_id)
         else:
-             _LOGGER.debug("%s: No active monitoring task to stop.", self.entity_id)
+            _LOGGER.debug(
+                "%s: Timer Expired: Heater power usage (%.2f) low or unavailable after %ds. OFF sequence complete.",
+                self.entity_id, power_after_delay if power_after_delay is not None else -1.0, Sleep_After_Power_Off
+            )
 
+        _LOGGER.info("%s: Timer Expired: Setting internal state to OFF.", self.entity_id)
+        self._attr_hvac_mode = HVACMode.OFF
+        self._heat_start_time = None
+        self._off_sequence_active = False
+        self.last_mode_change_time = time.monotonic()
+        self._write_state_if_changed()
 
-    # --- Monitoring Task ---
-    async def _monitor_power_and_temperature(self):
-        """Background task for timer and temperature maintenance while in HEAT mode."""
-        _LOGGER.info("Monitoring task started for %s.", self.entity_id)
-        try:
-            while True:
-                if self._attr_hvac_mode != HVACMode.HEAT:
-                    _LOGGER.info("%s: HVAC mode is no longer HEAT (%s). Stopping monitoring task.", self.entity_id, self._attr_hvac_mode)
-                    break
-
-                now = datetime.now(timezone.utc)
-
-                # --- 1. Timer Check --- # <<< CORRECTED TIMER LOGIC >>>
-                timer_duration_minutes = self._timer_duration_minutes
-                if timer_duration_minutes > 0 and self._heat_start_time:
-                    elapsed_seconds = (now - self._heat_start_time).total_seconds()
-                    timer_duration_seconds = timer_duration_minutes * 60
-
-                    if elapsed_seconds >= timer_duration_seconds:
-                        _LOGGER.info(
-                            "%s: Timer expired (elapsed %.1fs >= duration %ds). Initiating turn OFF sequence.",
-                            self.entity_id, elapsed_seconds, timer_duration_seconds
-                        )
-                        # --- Start Timer Turn Off Sequence ---
-                        _LOGGER.debug("%s: Timer Expired: Activating OFF scene (Attempt 1).", self.entity_id)
-                        first_activation_success = await self._activate_scene(
-                            self._scene_turn_on_off, "timer expired turn OFF (1st attempt)"
-                        )
-                        if not first_activation_success:
-                             _LOGGER.warning("%s: Timer Expired: First attempt to activate OFF scene failed.", self.entity_id)
-
-                        _LOGGER.debug("%s: Timer Expired: Waiting %d seconds before checking power state.", self.entity_id, Sleep_After_Power_Off)
-                        await asyncio.sleep(Sleep_After_Power_Off)
-
-                        _LOGGER.debug("%s: Timer Expired: Checking power state after delay.", self.entity_id)
-                        power_after_delay = self.current_power_usage
-
-                        if self._power_usage_sensor and power_after_delay is not None and power_after_delay >= VOLTAGE_ON_THRESHOLD:
-                            _LOGGER.warning(
-                                "%s: Timer Expired: Heater power usage (%.2f) still high after %ds. Activating OFF scene again (Attempt 2).",
-                                self.entity_id, power_after_delay, Sleep_After_Power_Off
-                            )
-                            await self._activate_scene(self._scene_turn_on_off, "timer expired turn OFF (2nd attempt)")
-                        elif not self._power_usage_sensor:
-                             _LOGGER.warning("%s: Timer Expired: Cannot verify power state after delay (no power sensor). Assuming OFF sequence complete.", self.entity_id)
-                        else:
-                            _LOGGER.debug(
-                                "%s: Timer Expired: Heater power usage (%.2f) low or unavailable after %ds. OFF sequence complete.",
-                                self.entity_id, power_after_delay if power_after_delay is not None else -1.0, Sleep_After_Power_Off
-                            )
-
-                        _LOGGER.info("%s: Timer Expired: Setting internal state to OFF.", self.entity_id)
-                        self._attr_hvac_mode = HVACMode.OFF
-                        self._heat_start_time = None
-                        self.last_mode_change_time = datetime.now(timezone.utc)
-                        self.async_write_ha_state()
-
-                        _LOGGER.debug("%s: Timer expiry sequence complete. Exiting monitoring loop.", self.entity_id)
-                        break
-                        # --- End Timer Turn Off Sequence ---
-
-                # --- 2. Temperature Maintenance Check (Only if Timer Didn't Expire) ---
-                if self._attr_hvac_mode == HVACMode.HEAT:
-                    current_temp = self.current_temperature
-                    target_temp = self._attr_target_temperature
-
-                    if current_temp is not None and target_temp is not None:
-                        difference = current_temp - target_temp
-                        power = self.current_power_usage
-
-                        _LOGGER.debug(
-                            "%s: [Monitor] Current: %.1f, Target: %.1f, Diff: %.1f, Power: %s",
-                            self.entity_id, current_temp, target_temp, difference, power
-                        )
-
-                        if self._power_usage_sensor and power is not None:
-                            # Temp too low AND heater seems OFF -> Try turning UP
-                            if difference < -1 and power <= VOLTAGE_ON_THRESHOLD:
-                                _LOGGER.debug("%s: [Monitor] Temp too low (%.1f) & power low. Activating UP scene.", self.entity_id, difference)
-                                if await self._activate_scene(self._temperature_up_scene, "monitor temp up"):
-                                    await asyncio.sleep(SCENE_ACTIVATION_DELAY)
-                                    await self._activate_scene(self._temperature_up_scene, "monitor temp up 2")
-
-                            # Temp too high AND heater seems ON -> Try turning DOWN
-                            elif difference > 1 and power >= VOLTAGE_ON_THRESHOLD:
-                                _LOGGER.debug("%s: [Monitor] Temp too high (%.1f) & power high. Activating DOWN scene.", self.entity_id, difference)
-                                if await self._activate_scene(self._temperature_down_scene, "monitor temp down"):
-                                    await asyncio.sleep(SCENE_ACTIVATION_DELAY)
-                                    await self._activate_scene(self._temperature_down_scene, "monitor temp down 2")
-                            else:
-                                _LOGGER.debug("%s: [Monitor] Temp/Power state OK (Diff: %.1f, Power: %.1f).", self.entity_id, difference, power)
-                        elif not self._power_usage_sensor:
-                            _LOGGER.debug("%s: [Monitor] Power sensor not configured. Skipping temperature maintenance.", self.entity_id)
-                        else: # power is None
-                            _LOGGER.debug("%s: [Monitor] Power sensor unavailable. Skipping temperature maintenance check.", self.entity_id)
-                    else:
-                        _LOGGER.debug("%s: [Monitor] Current or target temperature unavailable.", self.entity_id)
-
-                # --- Wait for next interval ---
-                if self._attr_hvac_mode == HVACMode.HEAT:
-                    _LOGGER.debug("%s: [Monitor] Sleeping for %d seconds.", self.entity_id, MONITORING_INTERVAL_SECONDS)
-                    await asyncio.sleep(MONITORING_INTERVAL_SECONDS)
-                else:
-                    _LOGGER.debug("%s: [Monitor] Mode changed during checks. Exiting loop instead of sleeping.", self.entity_id)
-                    break
-
-        except asyncio.CancelledError:
-            _LOGGER.info("%s: Monitoring task explicitly cancelled.", self.entity_id)
-        except Exception as e:
-            _LOGGER.exception("%s: Unhandled exception in monitoring task: %s", self.entity_id, e)
-        finally:
-            _LOGGER.info("%s: Monitoring task stopped.", self.entity_id)
-            if self._monitoring_task and self._monitoring_task.done():
-                self._monitoring_task = None
+
+    # --- Temperature Maintenance ---
+    @callback
+    def _cancel_maintenance_task(self) -> None:
+        """Cancel a running temperature maintenance task, if any."""
+        if self._maintenance_task is not None and not self._maintenance_task.done():
+            self._maintenance_task.cancel()
+        self._maintenance_task = None
+
+    async def _maintain_temperature(self) -> None:
+        """Nudge the heater with UP/DOWN scenes if temperature and power state disagree."""
+        if self._attr_hvac_mode != HVACMode.HEAT:
+            return
+
+        current_temp = self.current_temperature
+        target_temp = self._attr_target_temperature
+
+        if current_temp is None or target_temp is None:
+            _LOGGER.debug("%s: [Monitor] Current or target temperature unavailable.", self.entity_id)
+            return
+
+        difference = current_temp - target_temp
+        power = self.current_power_usage
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s: [Monitor] Current: %.1f, Target: %.1f, Diff: %.1f, Power: %s",
+                self.entity_id, current_temp, target_temp, difference, power
+            )
+
+        if self._power_usage_sensor and power is not None:
+            # Temp too low AND heater seems OFF -> Try turning UP
+            if difference < -1 and power <= VOLTAGE_ON_THRESHOLD:
+                _LOGGER.debug("%s: [Monitor] Temp too low (%.1f) & power low. Activating UP scene.", self.entity_id, difference)
+                await self._press_scene(self._temperature_up_scene, "monitor temp up", presses=2, blocking=False)
+
+            # Temp too high AND heater seems ON -> Try turning DOWN
+            elif difference > 1 and power >= VOLTAGE_ON_THRESHOLD:
+                _LOGGER.debug("%s: [Monitor] Temp too high (%.1f) & power high. Activating DOWN scene.", self.entity_id, difference)
+                await self._press_scene(self._temperature_down_scene, "monitor temp down", presses=2, blocking=False)
+            elif _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("%s: [Monitor] Temp/Power state OK (Diff: %.1f, Power: %.1f).", self.entity_id, difference, power)
+        elif _LOGGER.isEnabledFor(logging.DEBUG):
+            if not self._power_usage_sensor:
+                _LOGGER.debug("%s: [Monitor] Power sensor not configured. Skipping temperature maintenance.", self.entity_id)
+            else: # power is None
+                _LOGGER.debug("%s: [Monitor] Power sensor unavailable. Skipping temperature maintenance check.", self.entity_id)
 
 
     # --- Power Sensor Change Callback ---
     @callback
-    async def _async_power_sensor_changed(self, event: Event) -> None:
+    def _async_power_sensor_changed(self, event: Event) -> None:
         """Handle state changes of the power usage sensor to auto-turn ON."""
         new_state: State | None = event.data.get("new_state")
+        old_state: State | None = event.data.get("old_state")
+        # Attribute-only updates carry no new reading. While OFF they are still
+        # checked, so auto-on can fire once the post-OFF cooldown has passed.
+        if (
+            new_state is not None
+            and old_state is not None
+            and new_state.state == old_state.state
+            and self._attr_hvac_mode != HVACMode.OFF
+        ):
+            return
         entity_id = event.data.get("entity_id")
+        self._cached_power = self._parse_sensor_state(new_state, entity_id, "Power usage sensor")
 
-        if new_state is None or new_state.state in (None, "unknown", "unavailable"):
+        if new_state is None or new_state.state in _UNAVAILABLE_STATES:
             _LOGGER.debug("%s: Power sensor %s changed to unavailable state: %s. Ignoring.", self.entity_id, entity_id, new_state.state if new_state else "None")
             return
 
+        # Log guards below: this listener fires on every power reading
         if self._attr_hvac_mode != HVACMode.OFF:
-            _LOGGER.debug("%s: Power sensor %s changed, but climate is not OFF (Mode: %s). Ignoring for auto-on.", self.entity_id, entity_id, self._attr_hvac_mode)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("%s: Power sensor %s changed, but climate is not OFF (Mode: %s). Ignoring for auto-on.", self.entity_id, entity_id, self._attr_hvac_mode)
+            # In HEAT, a power change can mean the heater no longer matches the temperature
+            self._maybe_maintain_temperature()
             return
 
-        now = datetime.now(timezone.utc)
-        if self.last_mode_change_time and (now - self.last_mode_change_time) < timedelta(seconds=AUTO_ON_COOLDOWN_SECONDS):
+        now = time.monotonic()
+        if self.last_mode_change_time is not None and now - self.last_mode_change_time < AUTO_ON_COOLDOWN_SECONDS:
              _LOGGER.debug("%s: Power sensor %s changed, but mode changed recently (<%ds ago). Ignoring potential auto-on flip-back.", self.entity_id, entity_id, AUTO_ON_COOLDOWN_SECONDS)
              return
 
-        try:
-            power_usage = float(new_state.state)
-            _LOGGER.debug("%s: Power sensor %s changed to %.2f.", self.entity_id, entity_id, power_usage)
-        except (ValueError, TypeError):
-            _LOGGER.warning("%s: Power sensor %s returned non-numeric state: %s. Cannot check threshold.", self.entity_id, entity_id, new_state.state)
+        power_usage = self._cached_power
+        if power_usage is None:
+            _LOGGER.debug("%s: Power sensor %s returned non-numeric state: %s. Cannot check threshold.", self.entity_id, entity_id, new_state.state)
             return
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("%s: Power sensor %s changed to %.2f.", self.entity_id, entity_id, power_usage)
 
         # --- Auto-ON Logic ---
         if power_usage > VOLTAGE_ON_THRESHOLD:
@@ -453,30 +552,93 @@ class MyHeaterClimate(ClimateEntity, RestoreEntity):
             )
             # Set state to HEAT
             self._attr_hvac_mode = HVACMode.HEAT
-            current_time = datetime.now(timezone.utc)
             if self._heat_start_time is None: # Should be None if mode was OFF
-                 self._heat_start_time = current_time
-            self.last_mode_change_time = current_time
-            self.async_write_ha_state()
-            # Start the monitoring task
-            await self._start_monitoring_task()
-        else:
+                 self._heat_start_time = event.time_fired
+            self.last_mode_change_time = now
+            self._write_state_if_changed()
+            # Arm the off-timer
+            self._arm_off_timer()
+            self._maybe_maintain_temperature()
+        elif _LOGGER.isEnabledFor(logging.DEBUG):
              _LOGGER.debug("%s: Power sensor %s changed to %.2f, below threshold %.1f. No auto-on action needed.", self.entity_id, entity_id, power_usage, VOLTAGE_ON_THRESHOLD)
 
 
-    # --- Scene Activation Helper ---
-    async def _activate_scene(self, scene_entity_id, action_description=""):
+    # --- Temperature Sensor Change Callback ---
+    @callback
+    def _async_temperature_sensor_changed(self, event: Event) -> None:
+        """Cache the new temperature sensor value and publish it."""
+        new_state: State | None = event.data.get("new_state")
+        old_state: State | None = event.data.get("old_state")
+        # Skip attribute-only updates before parsing anything
+        if new_state is not None and old_state is not None and new_state.state == old_state.state:
+            return
+        new_temp = self._parse_sensor_state(new_state, self._temperature_sensor, "Temperature sensor")
+        if new_temp == self._cached_temp:
+            return
+        self._cached_temp = new_temp
+        self._write_state_if_changed()
+        self._maybe_maintain_temperature()
+
+    @callback
+    def _maybe_maintain_temperature(self) -> None:
+        """Schedule temperature maintenance if the reading drifted past target ± 1 in HEAT mode."""
+        current_temp = self._cached_temp
+        if (
+            self._attr_hvac_mode == HVACMode.HEAT
+            and not self._off_sequence_active  # Don't fight the timer OFF sequence
+            and current_temp is not None
+            and self._attr_target_temperature is not None
+            and abs(current_temp - self._attr_target_temperature) > 1
+        ):
+            # One maintenance sequence at a time; a running one already acts on fresh values
+            if self._maintenance_task is not None and not self._maintenance_task.done():
+                return
+            # Sensor readings change every few seconds; don't press UP/DOWN on each one
+            now = time.monotonic()
+            if self._last_maintenance is not None and now - self._last_maintenance < MONITORING_INTERVAL_SECONDS:
+                return
+            self._last_maintenance = now
+            self._maintenance_task = self.hass.async_create_background_task(
+                self._maintain_temperature(), name=f"my_heater.maintain.{self.entity_id}"
+            )
+
+
+    # --- Scene Activation Helpers ---
+    async def _press_scene(
+        self,
+        scene: str,
+        tag: str,
+        presses: int = 1,
+        delay: float = SCENE_ACTIVATION_DELAY,
+        blocking: bool = True,
+    ) -> bool:
+        """Activate a scene `presses` times, waiting `delay` after each press; True if every press succeeded."""
+        for press in range(1, presses + 1):
+            if not await self._activate_scene(scene, tag if press == 1 else f"{tag} {press}", blocking=blocking):
+                return False
+            await asyncio.sleep(delay)
+        return True
+
+    async def _activate_scene(self, scene_entity_id, action_description="", blocking=True):
         """Helper to call the scene.turn_on service."""
         if not scene_entity_id:
              _LOGGER.error("%s: Scene entity ID missing for action: %s", self.entity_id, action_description)
              return False
+        # Coalesce duplicate ON/OFF toggles from overlapping callers; a second press would undo the first.
+        # UP/DOWN steps are never coalesced, each press is a real step the caller counts.
+        if scene_entity_id == self._scene_turn_on_off:
+            now = time.monotonic()
+            if now - self._last_toggle_fire < SCENE_COALESCE_SECONDS:
+                _LOGGER.debug("%s: Toggle scene fired <%.2fs ago, coalescing action: %s", self.entity_id, SCENE_COALESCE_SECONDS, action_description)
+                return True
+            self._last_toggle_fire = now
         _LOGGER.debug("%s: Activating scene '%s' for action: %s", self.entity_id, scene_entity_id, action_description)
         try:
             await self.hass.services.async_call(
                 domain="scene",
                 service="turn_on",
-                service_data={"entity_id": scene_entity_id},
-                blocking=True
+                service_data=self._scene_payloads.get(scene_entity_id) or {"entity_id": scene_entity_id},
+                blocking=blocking
             )
             _LOGGER.debug("%s: Successfully called service for scene '%s'", self.entity_id, scene_entity_id)
             return True
@@ -487,7 +649,12 @@ class MyHeaterClimate(ClimateEntity, RestoreEntity):
         return False
 
 
-    # --- Entity Lifecycle and Options Handling ---
+    # --- Entity Lifecycle ---
+    @property
+    def extra_restore_state_data(self) -> RestoredExtraData:
+        """Store whether the timer OFF sequence was running, so a reload doesn't restore HEAT."""
+        return RestoredExtraData({"off_sequence_active": self._off_sequence_active})
+
     async def async_added_to_hass(self):
         """Run when entity about to be added to hass, including state restoration."""
         # Call RestoreEntity's async_added_to_hass first
@@ -503,11 +670,21 @@ class MyHeaterClimate(ClimateEntity, RestoreEntity):
             _LOGGER.debug("%s: Found last state: %s", self.entity_id, last_state)
             # Restore HVAC mode
             if last_state.state in self._attr_hvac_modes:
-                restored_mode = last_state.state
+                restored_mode = HVACMode(last_state.state)
                 _LOGGER.debug("%s: Restored hvac_mode: %s", self.entity_id, restored_mode)
             else:
                  _LOGGER.warning("%s: Invalid hvac_mode '%s' found in last state.", self.entity_id, last_state.state)
 
+            # A reload during the timer OFF sequence leaves HEAT stored, but the heater was already switched off
+            last_extra_data = await self.async_get_last_extra_data()
+            if (
+                restored_mode == HVACMode.HEAT
+                and last_extra_data is not None
+                and last_extra_data.as_dict().get("off_sequence_active")
+            ):
+                restored_mode = HVACMode.OFF
+                _LOGGER.debug("%s: Timer OFF sequence was running when last stored. Restoring OFF.", self.entity_id)
+
             # Restore target temperature
             if ATTR_TEMPERATURE in last_state.attributes:
                 temp_from_state = last_state.attributes[ATTR_TEMPERATURE]
@@ -527,7 +704,6 @@ class MyHeaterClimate(ClimateEntity, RestoreEntity):
 
         # --- Apply Restored State or Defaults ---
         self._attr_hvac_mode = restored_mode if restored_mode is not None else HVACMode.OFF
-        self._attr_hvac_mode = HVACMode.OFF
         self._attr_target_temperature = restored_temp if restored_temp is not None else self._default_temp # Use stored default
 
         _LOGGER.debug("%s: Final initial state - Mode: %s, Target Temp: %.1f",
@@ -535,60 +711,46 @@ class MyHeaterClimate(ClimateEntity, RestoreEntity):
 
         # If restored to HEAT mode, reset the start time
         if self._attr_hvac_mode == HVACMode.HEAT:
-             self._heat_start_time = datetime.now(timezone.utc)
+             self._heat_start_time = dt_util.utcnow()
              _LOGGER.debug("%s: Mode is HEAT after restoration/init, setting heat_start_time.", self.entity_id)
 
 
-        # --- Setup Listeners ---
-        self._options_listener_remove = self.config_entry.add_update_listener(
-            self._async_options_updated
-        )
-        _LOGGER.debug("%s: Added options update listener.", self.entity_id)
+        # --- Seed Sensor Caches (kept up to date by the listeners below) ---
+        if self._temperature_sensor:
+            self._cached_temp = self._parse_sensor_state(
+                self.hass.states.get(self._temperature_sensor), self._temperature_sensor, "Temperature sensor"
+            )
+        if self._power_usage_sensor:
+            self._cached_power = self._parse_sensor_state(
+                self.hass.states.get(self._power_usage_sensor), self._power_usage_sensor, "Power usage sensor"
+            )
+
+        # --- Setup Listeners (removed automatically by HA via async_on_remove) ---
+        # Options changes are handled by the entry reload in __init__.py, not here
 
         if self._power_usage_sensor:
             _LOGGER.debug("%s: Adding power sensor listener for %s", self.entity_id, self._power_usage_sensor)
-            self._power_sensor_listener_remove = async_track_state_change_event(
-                self.hass, [self._power_usage_sensor], self._async_power_sensor_changed
+            self.async_on_remove(
+                async_track_state_change_event(
+                    self.hass, [self._power_usage_sensor], self._async_power_sensor_changed
+                )
             )
         else:
             _LOGGER.debug("%s: Power sensor not configured, skipping auto-on listener setup.", self.entity_id)
 
-        # --- Start Monitoring Task if Needed ---
-        if self._attr_hvac_mode == HVACMode.HEAT:
-            if not self._monitoring_task or self._monitoring_task.done():
-               _LOGGER.info("%s: Starting monitoring task on add_to_hass as final mode is HEAT.", self.entity_id)
-               # Use create_task to avoid blocking setup if task takes time to start
-               self.hass.create_task(self._start_monitoring_task())
-
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity will be removed from hass."""
-        _LOGGER.debug("%s: Entity removing from HASS.", self.entity_id)
-        # Remove options listener
-        if self._options_listener_remove:
-            self._options_listener_remove()
-            _LOGGER.debug("%s: Removed options update listener.", self.entity_id)
-            self._options_listener_remove = None
-
-        # Remove power sensor listener
-        if self._power_sensor_listener_remove:
-            self._power_sensor_listener_remove()
-            _LOGGER.debug("%s: Removed power sensor listener.", self.entity_id)
-            self._power_sensor_listener_remove = None
-
-        # Stop monitoring task
-        await self._stop_monitoring_task()
-        # Call super last
-        await super().async_will_remove_from_hass()
-        _LOGGER.debug("%s: Entity removal complete.", self.entity_id)
+        if self._temperature_sensor:
+            self.async_on_remove(
+                async_track_state_change_event(
+                    self.hass, [self._temperature_sensor], self._async_temperature_sensor_changed
+                )
+            )
 
+        # Off-timer and OFF recheck are re-armed per HEAT cycle, so cancel whatever is pending
+        self.async_on_remove(self._cancel_off_timer)
+        self.async_on_remove(self._apply_debouncer.async_shutdown)
 
-    @callback
-    def _async_options_updated(self, hass: HomeAssistant, entry: ConfigEntry):
-        """Handle options update from the UI."""
-        _LOGGER.info(
-            "%s: Options updated: %s. Monitoring task will use new values on next check.",
-             self.entity_id, entry.options
-        )
-        # Update state if visual representation depends on options (e.g., timer display)
-        self.async_write_ha_state()
\ No newline at end of file
+        # --- Arm Off-Timer if Needed ---
+        if self._attr_hvac_mode == HVACMode.HEAT:
+            _LOGGER.info("%s: Arming off-timer on add_to_hass as final mode is HEAT.", self.entity_id)
+            self._arm_off_timer()
+            self._maybe_maintain_temperature()
@@ -12,6 +12,26 @@ from .const import DOMAIN
 import logging
 _LOGGER = logging.getLogger(__name__)
 
+
+# --- Schemas (built once at import) ---
+_TIMER_VALIDATOR = vol.All(vol.Coerce(int), Range(min=0))
+
+_INITIAL_SCHEMA = vol.Schema(
+     {
+        vol.Required("heater_name"): str,
+        vol.Required("scene_turn_on_off"): selector({"entity": {"domain": "scene"}}),
+        vol.Required("temperature_up_scene"): selector({"entity": {"domain": "scene"}}),
+        vol.Required("temperature_down_scene"): selector({"entity": {"domain": "scene"}}),
+        vol.Required("temperature_sensor"): selector({"entity": {"domain": "sensor", "device_class": "temperature"}}),
+        vol.Required("min_temp", default=16): vol.Coerce(float),
+        vol.Required("max_temp", default=30): vol.Coerce(float),
+        vol.Required("default_temp", default=20): vol.Coerce(float),
+        vol.Required("power_usage"): selector({"entity": {"domain": "sensor"}}),
+        vol.Required("timer", default=30): _TIMER_VALIDATOR,
+        vol.Optional("remember_last_temp", default=False): bool, # Stays Optional here
+    }
+)
+
 # --- Options Flow Handler ---
 class MyHeaterOptionsFlowHandler(config_entries.OptionsFlow):
     """Handle an options flow for My Heater."""
@@ -56,7 +76,7 @@ class MyHeaterOptionsFlowHandler(config_entries.OptionsFlow):
                 vol.Required(
                     "timer",
                     default=current_timer
-                ): vol.All(vol.Coerce(int), Range(min=0)),
+                ): _TIMER_VALIDATOR,
 
                 # --- ADDED: remember_last_temp field ---
                 # Use vol.Optional here consistent with initial setup schema
@@ -105,27 +125,10 @@ class MyHeaterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 # async_create_entry stores user_input in the `.data` attribute
                 return self.async_create_entry(title=user_input["heater_name"], data=user_input)
 
-        # --- Schema for initial setup (Unchanged) ---
-        initial_schema = vol.Schema(
-             {
-                vol.Required("heater_name"): str,
-                vol.Required("scene_turn_on_off"): selector({"entity": {"domain": "scene"}}),
-                vol.Required("temperature_up_scene"): selector({"entity": {"domain": "scene"}}),
-                vol.Required("temperature_down_scene"): selector({"entity": {"domain": "scene"}}),
-                vol.Required("temperature_sensor"): selector({"entity": {"domain": "sensor", "device_class": "temperature"}}),
-                vol.Required("min_temp", default=16): vol.Coerce(float),
-                vol.Required("max_temp", default=30): vol.Coerce(float),
-                vol.Required("default_temp", default=20): vol.Coerce(float),
-                vol.Required("power_usage"): selector({"entity": {"domain": "sensor"}}),
-                vol.Required("timer", default=30): vol.All(vol.Coerce(int), Range(min=0)),
-                vol.Optional("remember_last_temp", default=False): bool, # Stays Optional here
-            }
-        )
-
-        # Show the form to the user for initial setup
+        # Show the form to the user for initial setup (schema is static, see _INITIAL_SCHEMA)
         return self.async_show_form(
             step_id="user",
-            data_schema=initial_schema,
+            data_schema=_INITIAL_SCHEMA,
             errors=errors
             # Add description placeholders if helpful
         )
@@ -1,2 +1,4 @@
-DOMAIN = "my_heater"
-PLATFORMS = ["climate"]
+from typing import Final
+
+DOMAIN: Final = "my_heater"
+PLATFORMS: Final = ("climate",)